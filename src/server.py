@@ -1,46 +1,327 @@
 #!/usr/bin/env python3
 import os
+import re
+import sys
+import asyncio
+import functools
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Awaitable, AsyncIterator, Tuple
+import httpx
+import orjson
+from cachetools import LRUCache, TTLCache
 from fastmcp import FastMCP
-from github import Github
+from fastmcp.exceptions import ToolError
 
-mcp = FastMCP("GitPulse MCP Server")
-
-# Initialize GitHub client
-def get_github_client() -> Github:
-    """Get authenticated GitHub client"""
-    token = os.environ.get("GITHUB_TOKEN")
-    if token:
-        return Github(token)
-    else:
-        # Use public API without authentication (rate limited)
-        return Github()
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared GitHub client when the server shuts down"""
+    try:
+        yield
+    finally:
+        await _client.aclose()
+
+mcp = FastMCP("GitPulse MCP Server", lifespan=_lifespan)
+
+GITHUB_API_URL = "https://api.github.com"
+
+# The environment is fixed for the life of the process, so resolve it once
+_GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+_HAS_TOKEN = bool(_GITHUB_TOKEN)
+_AUTH_HEADER = {"Authorization": f"Bearer {_GITHUB_TOKEN}"} if _HAS_TOKEN else {}
+_PY_VERSION = sys.version.split()[0]
+
+# Default headers for GitHub API requests, without a token we use the public
+# API (rate limited). Pinning the API version keeps response shapes stable.
+_GH_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+    **_AUTH_HEADER
+}
+
+def _new_client() -> httpx.AsyncClient:
+    """Create a GitHub API client that multiplexes requests over HTTP/2"""
+    return httpx.AsyncClient(
+        base_url=GITHUB_API_URL,
+        http2=True,
+        headers=_GH_HEADERS,
+        # Renamed and transferred repositories answer with 301 to the new location
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60)
+    )
 
+# Shared GitHub client, reused across all tool invocations. Idle connections
+# are kept alive between polls so repeated tool calls skip the TCP and TLS
+# handshakes.
+_client = _new_client()
+
+def get_github_client() -> httpx.AsyncClient:
+    """Get the shared GitHub API client, recreating it if a lifespan has closed it"""
+    global _client
+    if _client.is_closed:
+        _client = _new_client()
+    return _client
+
+# Maximum number of GitHub requests in flight across all tools
+_REQUEST_LIMIT = asyncio.Semaphore(60)
+
+# Longest rate limit reset (in seconds) worth waiting for instead of failing
+_MAX_RATE_LIMIT_WAIT = 60
+
+# Requests are held back until these times once GitHub reports a rate limit,
+# keyed by rate limit resource since core, search and GraphQL have separate quotas
+_rate_limited_until: Dict[str, float] = {}
+
+def _rate_limit_resource(url: str) -> str:
+    """Get the GitHub rate limit resource a request is counted against"""
+    path = httpx.URL(url).path
+    if path.startswith("/search/code"):
+        return "code_search"
+    if path.startswith("/search/"):
+        return "search"
+    if path == "/graphql":
+        return "graphql"
+    return "core"
+
+def _rate_limit_delay(response: httpx.Response) -> Optional[float]:
+    """Get the seconds to wait before retrying a rate limited response, or None if it was not rate limited"""
+    if response.status_code not in (403, 429):
+        return None
+
+    # Secondary rate limits tell us how long to back off
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        return float(retry_after)
+
+    # Primary rate limit exhausted until the reset time
+    if response.headers.get("X-RateLimit-Remaining") == "0" and response.headers.get("X-RateLimit-Reset"):
+        return max(0.0, float(response.headers["X-RateLimit-Reset"]) - time.time())
+    return None
+
+def _is_transient(error: Exception) -> bool:
+    """Check whether a failed GitHub request may succeed when retried (network errors, 5xx and rate limits)"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or _rate_limit_delay(error.response) is not None
+    return True
+
+async def _gh_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Send a GitHub API request, sharing rate limit backoff across all tools using the same resource"""
+    resource = _rate_limit_resource(url)
+
+    for attempt in range(2):
+        # Wait out a known rate limit instead of spending more requests on it
+        wait = _rate_limited_until.get(resource, 0.0) - time.time()
+        if wait > _MAX_RATE_LIMIT_WAIT:
+            raise Exception(f"GitHub API rate limit exceeded, resets in {int(wait)} seconds")
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        async with _REQUEST_LIMIT:
+            response = await get_github_client().request(method, url, **kwargs)
+
+        delay = _rate_limit_delay(response)
+        if delay is None:
+            return response
+        limited = response.headers.get("X-RateLimit-Resource", resource)
+        _rate_limited_until[limited] = max(_rate_limited_until.get(limited, 0.0), time.time() + delay)
+
+    return response
+
+# Conditional request cache: request key -> (ETag, parsed result), keeping the
+# most recently used requests. List endpoints store their projected rows rather
+# than the full payload to keep entries small. Cached results are shared
+# between calls and must be treated as read-only.
+_etag_cache: LRUCache = LRUCache(maxsize=1024)
+
+async def _gh_fetch(url: str, params: Optional[Dict[str, Any]], parse: Callable[[httpx.Response], Any]) -> Any:
+    """Issue a conditional GET request, reusing the cached result when GitHub answers 304 Not Modified"""
+    # Pollers send a fresh 'since' on every call, so those requests never revalidate
+    cacheable = not (params and "since" in params)
+    key = str(httpx.URL(url, params=sorted(params.items()) if params else None))
+    cached = _etag_cache.get(key) if cacheable else None
+    headers = {"If-None-Match": cached[0]} if cached else None
+
+    response = await _gh_request("GET", url, params=params, headers=headers)
+    if cached and response.status_code == 304:
+        return cached[1]
+    response.raise_for_status()
+
+    result = parse(response)
+    etag = response.headers.get("ETag")
+    if etag and cacheable:
+        _etag_cache[key] = (etag, result)
+    return result
+
+def _parse_json(response: httpx.Response) -> Any:
+    """Parse a GitHub API response body"""
+    return orjson.loads(response.content)
+
+# Page number of the rel="last" entry in a Link header
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+def _parse_count(response: httpx.Response) -> int:
+    """Count the items of a paginated GitHub collection fetched with per_page=1"""
+    # Empty collections (e.g. contributors of an empty repository) return 204
+    if response.status_code == 204:
+        return 0
+
+    # With one item per page, the last page number is the total count
+    match = _LAST_PAGE_RE.search(response.headers.get("Link", ""))
+    if match:
+        return int(match.group(1))
+
+    # No rel="last" link means everything fit on a single page
+    return len(_parse_json(response))
+
+async def _gh_get(url: str, params: Optional[Dict[str, Any]] = None, project: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Issue a GET request against the GitHub API and return the parsed JSON body, projected if requested"""
+    if project is None:
+        return await _gh_fetch(url, params, _parse_json)
+    return await _gh_fetch(url, params, lambda response: project(_parse_json(response)))
+
+async def _gh_count(url: str, params: Optional[Dict[str, Any]] = None) -> int:
+    """Count the items of a paginated GitHub collection using a single request"""
+    return await _gh_fetch(url, {**(params or {}), "per_page": 1}, _parse_count)
+
+def _page_size(per_page: int) -> int:
+    """Clamp a requested page size to what the GitHub API accepts (1-100)"""
+    return max(1, min(per_page, 100))
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO 8601 timestamp, memoized since pollers reuse the same 'since' value"""
+    # fromisoformat only accepts the "Z" suffix from Python 3.11
+    if timestamp.endswith("Z") and sys.version_info < (3, 11):
+        timestamp = timestamp[:-1] + "+00:00"
+    return datetime.fromisoformat(timestamp)
+
+def _login(user: Optional[Dict[str, Any]]) -> str:
+    """Get the login of a user object, which GitHub omits for deleted accounts"""
+    return user["login"] if user else "Unknown"
+
+# Reaction counters reported for issues and comments
+_REACTION_KEYS = ("total_count", "+1", "-1", "laugh", "hooray", "confused", "heart", "rocket", "eyes")
+
+def _reactions_of(obj: Dict[str, Any]) -> Dict[str, int]:
+    """Project the reaction counters of an issue or comment"""
+    reactions = obj.get("reactions")
+    return {key: reactions[key] for key in _REACTION_KEYS} if reactions else {}
+
+@functools.lru_cache(maxsize=1024)
 def parse_repository(repo_str: str):
     """Parse repository string in format 'owner/repo'"""
-    parts = repo_str.split("/")
-    if len(parts) != 2:
+    owner, sep, name = repo_str.partition("/")
+    if not sep or not owner or not name or "/" in name:
         raise ValueError("Repository must be in format 'owner/repo'")
-    return parts[0], parts[1]
+    return owner, name
+
+async def _gh_graphql(query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a GraphQL query against the GitHub API and return its data"""
+    response = await _gh_request("POST", "/graphql", json={"query": query, "variables": variables})
+    response.raise_for_status()
+    body = _parse_json(response)
+    if body.get("errors"):
+        raise Exception("; ".join(error["message"] for error in body["errors"]))
+    return body["data"]
+
+# Repository metadata rarely changes, so keep it for a few minutes
+_repo_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+async def _get_repo(repository: str) -> Dict[str, Any]:
+    """Get repository metadata, cached across tool invocations"""
+    repo = _repo_cache.get(repository)
+    if repo is None:
+        owner, repo_name = parse_repository(repository)
+        repo = await _gh_get(f"/repos/{owner}/{repo_name}")
+        _repo_cache[repository] = repo
+    return repo
+
+# Maximum number of repositories fetched concurrently by the batch tools
+_MULTI_CONCURRENCY = 10
+
+async def _gather_repositories(repositories: List[str], fetch: Callable[[str], Awaitable[Any]], error: str) -> Dict[str, Any]:
+    """Run a per-repository fetch for many repositories concurrently, keyed by repository"""
+    semaphore = asyncio.Semaphore(_MULTI_CONCURRENCY)
+
+    async def fetch_one(repository: str) -> Any:
+        async with semaphore:
+            try:
+                return await fetch(repository)
+            except Exception as e:
+                # Report failures per repository instead of failing the whole batch
+                return {"error": f"{error}: {str(e)}"}
+
+    results = await asyncio.gather(*[fetch_one(repository) for repository in repositories])
+    return dict(zip(repositories, results))
+
+def _gh_tool(action: str) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Report any failure of the wrapped tool as a ToolError prefixed with what it was doing"""
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                raise ToolError(f"Error {action}: {str(e)}") from e
+        return wrapper
+    return decorator
 
 @mcp.tool(description="Greet a user by name with a welcome message from the GitPulse MCP server")
 def greet(name: str) -> str:
     return f"Hello, {name}! Welcome to GitPulse - your GitHub monitoring MCP server!"
 
-@mcp.tool(description="Get information about the GitPulse MCP server including name, version, environment, and Python version")
-def get_server_info() -> dict:
+@functools.cache
+def _server_info() -> Dict[str, Any]:
+    """Build the server information once, the environment is fixed for the life of the process"""
     return {
         "server_name": "GitPulse MCP Server",
         "version": "1.0.0",
         "description": "GitHub repository monitoring MCP server",
+        "python_version": _PY_VERSION,
         "environment": os.environ.get("ENVIRONMENT", "development"),
-        "python_version": os.sys.version.split()[0],
-        "github_token_configured": bool(os.environ.get("GITHUB_TOKEN"))
+        "github_token_configured": _HAS_TOKEN
+    }
+
+@mcp.tool(description="Get information about the GitPulse MCP server including name, version, environment, and Python version")
+def get_server_info() -> dict:
+    return _server_info()
+
+def _project_commit(commit: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a commit payload onto the fields returned by fetchNewCommits"""
+    commit_data = commit["commit"]
+    author = commit_data["author"] or {}
+
+    return {
+        "sha": commit["sha"],
+        "message": commit_data["message"],
+        "author": author.get("name") or "Unknown",
+        "date": author.get("date") or "",
+        "url": commit["html_url"]
     }
 
+async def _fetch_commits_one(repository: str, per_page: int, since: Optional[str]) -> List[Dict[str, Any]]:
+    """Fetch recent commits from a single repository"""
+    owner, repo_name = parse_repository(repository)
+
+    # Prepare parameters
+    per_page = _page_size(per_page)
+    params = {"per_page": per_page}
+
+    if since:
+        # Parse ISO 8601 timestamp
+        params['since'] = _parse_iso(since).isoformat()
+
+    # Get commits
+    return await _gh_get(
+        f"/repos/{owner}/{repo_name}/commits",
+        params,
+        lambda commits: [_project_commit(commit) for commit in commits]
+    )
+
 @mcp.tool(description="Fetch recent commits from a GitHub repository")
-def fetchNewCommits(repository: str, per_page: int = 30, since: str = None) -> List[Dict[str, Any]]:
+@_gh_tool("fetching commits")
+async def fetchNewCommits(repository: str, per_page: int = 30, since: str = None) -> List[Dict[str, Any]]:
     """
     Fetch recent commits from a GitHub repository.
 
@@ -52,48 +333,41 @@ def fetchNewCommits(repository: str, per_page: int = 30, since: str = None) -> L
     Returns:
         List of commit objects with sha, message, author, date, and url
     """
-    try:
-        github = get_github_client()
-        owner, repo_name = parse_repository(repository)
-
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
-
-        # Prepare parameters
-        per_page = min(per_page, 100)  # GitHub API limit
-        kwargs = {}
-
-        if since:
-            # Parse ISO 8601 timestamp
-            since_date = datetime.fromisoformat(since.replace('Z', '+00:00'))
-            kwargs['since'] = since_date
+    return await _fetch_commits_one(repository, per_page, since)
 
-        # Get commits
-        commits = repo.get_commits(**kwargs)
-
-        # Convert to list with pagination
-        results = []
-        count = 0
-        for commit in commits:
-            if count >= per_page:
-                break
+@mcp.tool(description="Fetch recent commits from several GitHub repositories at once")
+async def fetchNewCommitsMulti(repositories: List[str], per_page: int = 30, since: str = None) -> Dict[str, Any]:
+    """
+    Fetch recent commits from several GitHub repositories concurrently.
 
-            results.append({
-                "sha": commit.sha,
-                "message": commit.commit.message,
-                "author": commit.commit.author.name if commit.commit.author else "Unknown",
-                "date": commit.commit.author.date.isoformat() if commit.commit.author and commit.commit.author.date else "",
-                "url": commit.html_url
-            })
-            count += 1
+    Args:
+        repositories: Repositories in format 'owner/repo' (e.g., ['microsoft/vscode', 'facebook/react'])
+        per_page: Number of commits to fetch per repository (max 100, default 30)
+        since: ISO 8601 timestamp to fetch commits since (optional)
 
-        return results
+    Returns:
+        Dictionary mapping each repository to its list of commit objects, or to an error object if fetching failed
+    """
+    return await _gather_repositories(
+        repositories,
+        lambda repository: _fetch_commits_one(repository, per_page, since),
+        "Error fetching commits"
+    )
 
-    except Exception as e:
-        raise Exception(f"Error fetching commits: {str(e)}")
+def _project_pull(pr: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a pull request payload onto the fields returned by fetchNewPRs"""
+    return {
+        "number": pr["number"],
+        "title": pr["title"],
+        "author": _login(pr["user"]),
+        "state": pr["state"],
+        "created_at": pr["created_at"] or "",
+        "html_url": pr["html_url"]
+    }
 
 @mcp.tool(description="Fetch pull requests from a GitHub repository")
-def fetchNewPRs(repository: str, state: str = "open", per_page: int = 30) -> List[Dict[str, Any]]:
+@_gh_tool("fetching pull requests")
+async def fetchNewPRs(repository: str, state: str = "open", per_page: int = 30) -> List[Dict[str, Any]]:
     """
     Fetch pull requests from a GitHub repository.
 
@@ -105,47 +379,38 @@ def fetchNewPRs(repository: str, state: str = "open", per_page: int = 30) -> Lis
     Returns:
         List of PR objects with number, title, author, state, created_at, and html_url
     """
-    try:
-        github = get_github_client()
-        owner, repo_name = parse_repository(repository)
-
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
+    owner, repo_name = parse_repository(repository)
 
-        # Prepare parameters
-        per_page = min(per_page, 100)  # GitHub API limit
+    # Prepare parameters
+    per_page = _page_size(per_page)
 
-        # Get pull requests
-        pulls = repo.get_pulls(
-            state=state,
-            sort="created",
-            direction="desc"
-        )
-
-        # Convert to list with pagination
-        results = []
-        count = 0
-        for pr in pulls:
-            if count >= per_page:
-                break
+    # Get pull requests
+    return await _gh_get(f"/repos/{owner}/{repo_name}/pulls", {
+        "state": state,
+        "sort": "created",
+        "direction": "desc",
+        "per_page": per_page
+    }, lambda pulls: [_project_pull(pr) for pr in pulls])
 
-            results.append({
-                "number": pr.number,
-                "title": pr.title,
-                "author": pr.user.login if pr.user else "Unknown",
-                "state": pr.state,
-                "created_at": pr.created_at.isoformat() if pr.created_at else "",
-                "html_url": pr.html_url
-            })
-            count += 1
-
-        return results
+def _project_issue(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Project an issue payload onto the fields returned by fetchNewIssues"""
+    return {
+        "number": issue["number"],
+        "title": issue["title"],
+        "author": _login(issue["user"]),
+        "state": issue["state"],
+        "created_at": issue["created_at"] or "",
+        "labels": [label["name"] for label in issue["labels"]] if issue["labels"] else [],
+        "assignees": [assignee["login"] for assignee in issue["assignees"]] if issue["assignees"] else [],
+        "html_url": issue["html_url"]
+    }
 
-    except Exception as e:
-        raise Exception(f"Error fetching pull requests: {str(e)}")
+# Most list pages scanned to fill a page of issues in repositories busy with pull requests
+_MAX_ISSUE_PAGES = 10
 
 @mcp.tool(description="Fetch issues from a GitHub repository")
-def fetchNewIssues(repository: str, state: str = "open", per_page: int = 30, labels: str = None) -> List[Dict[str, Any]]:
+@_gh_tool("fetching issues")
+async def fetchNewIssues(repository: str, state: str = "open", per_page: int = 30, labels: str = None) -> List[Dict[str, Any]]:
     """
     Fetch issues from a GitHub repository.
 
@@ -156,59 +421,53 @@ def fetchNewIssues(repository: str, state: str = "open", per_page: int = 30, lab
         labels: Comma-separated list of labels to filter by (optional)
 
     Returns:
-        List of issue objects with number, title, author, state, created_at, labels, and html_url
+        List of issue objects with number, title, author, state, created_at, labels, and html_url.
+        Pull requests are skipped, so fewer than per_page issues come back only when the repository
+        has no more, or when the first 10 pages hold too few.
     """
-    try:
-        github = get_github_client()
-        owner, repo_name = parse_repository(repository)
+    owner, repo_name = parse_repository(repository)
 
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
+    # Prepare parameters
+    per_page = _page_size(per_page)
 
-        # Prepare parameters
-        per_page = min(per_page, 100)  # GitHub API limit
-        kwargs = {
-            "state": state,
-            "sort": "created",
-            "direction": "desc"
-        }
-
-        if labels:
-            kwargs["labels"] = [label.strip() for label in labels.split(",")]
-
-        # Get issues
-        issues = repo.get_issues(**kwargs)
+    params = {
+        "state": state,
+        "sort": "created",
+        "direction": "desc",
+        "per_page": per_page
+    }
 
-        # Convert to list with pagination
-        results = []
-        count = 0
-        for issue in issues:
-            if count >= per_page:
-                break
+    if labels:
+        params["labels"] = ",".join(label.strip() for label in labels.split(","))
 
+    def parse_page(response: httpx.Response) -> Tuple[List[Dict[str, Any]], bool]:
+        issues = [
+            _project_issue(issue)
+            for issue in _parse_json(response)
             # Skip pull requests (GitHub API treats PRs as issues)
-            if issue.pull_request:
-                continue
-
-            results.append({
-                "number": issue.number,
-                "title": issue.title,
-                "author": issue.user.login if issue.user else "Unknown",
-                "state": issue.state,
-                "created_at": issue.created_at.isoformat() if issue.created_at else "",
-                "labels": [label.name for label in issue.labels] if issue.labels else [],
-                "assignees": [assignee.login for assignee in issue.assignees] if issue.assignees else [],
-                "html_url": issue.html_url
-            })
-            count += 1
-
-        return results
-
-    except Exception as e:
-        raise Exception(f"Error fetching issues: {str(e)}")
+            if not issue.get("pull_request")
+        ]
+        return issues, 'rel="next"' in response.headers.get("Link", "")
+
+    # Get issues from the list endpoint rather than search, which has a much
+    # smaller per-minute quota and can lag newly opened issues. Pull requests
+    # take up room on each page, so keep paging until enough issues are found.
+    results = []
+    for page in range(1, _MAX_ISSUE_PAGES + 1):
+        issues, has_next = await _gh_fetch(
+            f"/repos/{owner}/{repo_name}/issues",
+            {**params, "page": page} if page > 1 else params,
+            parse_page
+        )
+        results.extend(issues)
+        if len(results) >= per_page or not has_next:
+            break
+
+    return results[:per_page]
 
 @mcp.tool(description="Fetch detailed information about a specific GitHub issue")
-def fetchIssueDetails(repository: str, issue_number: int) -> Dict[str, Any]:
+@_gh_tool("fetching issue details")
+async def fetchIssueDetails(repository: str, issue_number: int) -> Dict[str, Any]:
     """
     Fetch detailed information about a specific GitHub issue.
 
@@ -219,67 +478,67 @@ def fetchIssueDetails(repository: str, issue_number: int) -> Dict[str, Any]:
     Returns:
         Dictionary with detailed issue information including body, comments count, reactions, and timeline
     """
-    try:
-        github = get_github_client()
-        owner, repo_name = parse_repository(repository)
+    owner, repo_name = parse_repository(repository)
 
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
-
-        # Get the specific issue
-        issue = repo.get_issue(issue_number)
-
-        # Skip if this is actually a pull request
-        if issue.pull_request:
-            raise ValueError(f"Issue #{issue_number} is actually a pull request. Use PR-specific tools instead.")
-
-        # Build detailed issue information
-        result = {
-            "number": issue.number,
-            "title": issue.title,
-            "body": issue.body if issue.body else "",
-            "author": issue.user.login if issue.user else "Unknown",
-            "state": issue.state,
-            "created_at": issue.created_at.isoformat() if issue.created_at else "",
-            "updated_at": issue.updated_at.isoformat() if issue.updated_at else "",
-            "closed_at": issue.closed_at.isoformat() if issue.closed_at else None,
-            "labels": [{"name": label.name, "color": label.color, "description": label.description} for label in issue.labels] if issue.labels else [],
-            "assignees": [{"login": assignee.login, "html_url": assignee.html_url} for assignee in issue.assignees] if issue.assignees else [],
-            "milestone": {
-                "title": issue.milestone.title,
-                "description": issue.milestone.description,
-                "state": issue.milestone.state,
-                "due_on": issue.milestone.due_on.isoformat() if issue.milestone.due_on else None
-            } if issue.milestone else None,
-            "comments_count": issue.comments,
-            "reactions": {
-                "total_count": issue.reactions["total_count"],
-                "+1": issue.reactions["+1"],
-                "-1": issue.reactions["-1"],
-                "laugh": issue.reactions["laugh"],
-                "hooray": issue.reactions["hooray"],
-                "confused": issue.reactions["confused"],
-                "heart": issue.reactions["heart"],
-                "rocket": issue.reactions["rocket"],
-                "eyes": issue.reactions["eyes"]
-            } if hasattr(issue, 'reactions') else {},
-            "locked": issue.locked,
-            "active_lock_reason": issue.active_lock_reason,
-            "html_url": issue.html_url,
-            "repository": {
-                "name": repo.name,
-                "full_name": repo.full_name,
-                "html_url": repo.html_url
-            }
+    # Get the repository and the specific issue concurrently
+    repo, issue = await asyncio.gather(
+        _get_repo(repository),
+        _gh_get(f"/repos/{owner}/{repo_name}/issues/{issue_number}")
+    )
+
+    # Skip if this is actually a pull request
+    if issue.get("pull_request"):
+        raise ValueError(f"Issue #{issue_number} is actually a pull request. Use PR-specific tools instead.")
+
+    # Build detailed issue information
+    milestone = issue["milestone"]
+    result = {
+        "number": issue["number"],
+        "title": issue["title"],
+        "body": issue["body"] if issue["body"] else "",
+        "author": _login(issue["user"]),
+        "state": issue["state"],
+        "created_at": issue["created_at"] or "",
+        "updated_at": issue["updated_at"] or "",
+        "closed_at": issue["closed_at"],
+        "labels": [{"name": label["name"], "color": label["color"], "description": label["description"]} for label in issue["labels"]] if issue["labels"] else [],
+        "assignees": [{"login": assignee["login"], "html_url": assignee["html_url"]} for assignee in issue["assignees"]] if issue["assignees"] else [],
+        "milestone": {
+            "title": milestone["title"],
+            "description": milestone["description"],
+            "state": milestone["state"],
+            "due_on": milestone["due_on"]
+        } if milestone else None,
+        "comments_count": issue["comments"],
+        "reactions": _reactions_of(issue),
+        "locked": issue["locked"],
+        "active_lock_reason": issue["active_lock_reason"],
+        "html_url": issue["html_url"],
+        "repository": {
+            "name": repo["name"],
+            "full_name": repo["full_name"],
+            "html_url": repo["html_url"]
         }
+    }
 
-        return result
+    return result
 
-    except Exception as e:
-        raise Exception(f"Error fetching issue details: {str(e)}")
+def _project_comment(comment: Dict[str, Any]) -> Dict[str, Any]:
+    """Project an issue comment payload onto the fields returned by fetchIssueComments"""
+    return {
+        "id": comment["id"],
+        "body": comment["body"] if comment["body"] else "",
+        "author": _login(comment["user"]),
+        "author_association": comment.get("author_association", "NONE"),
+        "created_at": comment["created_at"] or "",
+        "updated_at": comment["updated_at"] or "",
+        "html_url": comment["html_url"],
+        "reactions": _reactions_of(comment)
+    }
 
 @mcp.tool(description="Fetch comments from a specific GitHub issue")
-def fetchIssueComments(repository: str, issue_number: int, per_page: int = 30) -> List[Dict[str, Any]]:
+@_gh_tool("fetching issue comments")
+async def fetchIssueComments(repository: str, issue_number: int, per_page: int = 30) -> List[Dict[str, Any]]:
     """
     Fetch comments from a specific GitHub issue.
 
@@ -291,64 +550,30 @@ def fetchIssueComments(repository: str, issue_number: int, per_page: int = 30) -
     Returns:
         List of comment objects with id, body, author, created_at, updated_at, and reactions
     """
-    try:
-        github = get_github_client()
-        owner, repo_name = parse_repository(repository)
+    owner, repo_name = parse_repository(repository)
+
+    # Prepare parameters
+    per_page = _page_size(per_page)
+
+    # Get the specific issue and its comments concurrently
+    issue, comments = await asyncio.gather(
+        _gh_get(f"/repos/{owner}/{repo_name}/issues/{issue_number}"),
+        _gh_get(
+            f"/repos/{owner}/{repo_name}/issues/{issue_number}/comments",
+            {"per_page": per_page},
+            lambda comments: [_project_comment(comment) for comment in comments]
+        )
+    )
+
+    # Skip if this is actually a pull request
+    if issue.get("pull_request"):
+        raise ValueError(f"Issue #{issue_number} is actually a pull request. Use PR-specific tools instead.")
 
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
-
-        # Get the specific issue
-        issue = repo.get_issue(issue_number)
-
-        # Skip if this is actually a pull request
-        if issue.pull_request:
-            raise ValueError(f"Issue #{issue_number} is actually a pull request. Use PR-specific tools instead.")
-
-        # Prepare parameters
-        per_page = min(per_page, 100)  # GitHub API limit
-
-        # Get comments
-        comments = issue.get_comments()
-
-        # Convert to list with pagination
-        results = []
-        count = 0
-        for comment in comments:
-            if count >= per_page:
-                break
-
-            result_comment = {
-                "id": comment.id,
-                "body": comment.body if comment.body else "",
-                "author": comment.user.login if comment.user else "Unknown",
-                "author_association": comment.author_association if hasattr(comment, 'author_association') else "NONE",
-                "created_at": comment.created_at.isoformat() if comment.created_at else "",
-                "updated_at": comment.updated_at.isoformat() if comment.updated_at else "",
-                "html_url": comment.html_url,
-                "reactions": {
-                    "total_count": comment.reactions["total_count"],
-                    "+1": comment.reactions["+1"],
-                    "-1": comment.reactions["-1"],
-                    "laugh": comment.reactions["laugh"],
-                    "hooray": comment.reactions["hooray"],
-                    "confused": comment.reactions["confused"],
-                    "heart": comment.reactions["heart"],
-                    "rocket": comment.reactions["rocket"],
-                    "eyes": comment.reactions["eyes"]
-                } if hasattr(comment, 'reactions') else {}
-            }
-
-            results.append(result_comment)
-            count += 1
-
-        return results
-
-    except Exception as e:
-        raise Exception(f"Error fetching issue comments: {str(e)}")
+    return comments
 
 @mcp.tool(description="Add a comment to a GitHub issue")
-def addIssueComment(repository: str, issue_number: int, comment_body: str) -> Dict[str, Any]:
+@_gh_tool("adding comment to issue")
+async def addIssueComment(repository: str, issue_number: int, comment_body: str) -> Dict[str, Any]:
     """
     Add a comment to a specific GitHub issue.
 
@@ -360,57 +585,55 @@ def addIssueComment(repository: str, issue_number: int, comment_body: str) -> Di
     Returns:
         Dictionary with the created comment information including id, body, author, and creation time
     """
-    try:
-        github = get_github_client()
+    # Check if we have authentication
+    if not _HAS_TOKEN:
+        raise Exception("GitHub token is required to add comments. Please set the GITHUB_TOKEN environment variable.")
 
-        # Check if we have authentication
-        if not os.environ.get("GITHUB_TOKEN"):
-            raise Exception("GitHub token is required to add comments. Please set the GITHUB_TOKEN environment variable.")
+    owner, repo_name = parse_repository(repository)
 
-        owner, repo_name = parse_repository(repository)
+    # Get the specific issue
+    issue = await _gh_get(f"/repos/{owner}/{repo_name}/issues/{issue_number}")
 
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
-
-        # Get the specific issue
-        issue = repo.get_issue(issue_number)
-
-        # Skip if this is actually a pull request
-        if issue.pull_request:
-            raise ValueError(f"Issue #{issue_number} is actually a pull request. Use PR-specific tools instead.")
-
-        # Check if the issue is locked
-        if issue.locked:
-            raise Exception(f"Issue #{issue_number} is locked and cannot accept new comments.")
-
-        # Validate comment body
-        if not comment_body or not comment_body.strip():
-            raise ValueError("Comment body cannot be empty.")
-
-        # Add the comment
-        comment = issue.create_comment(comment_body.strip())
-
-        # Return the created comment information
-        result = {
-            "id": comment.id,
-            "body": comment.body,
-            "author": comment.user.login if comment.user else "Unknown",
-            "author_association": comment.author_association if hasattr(comment, 'author_association') else "NONE",
-            "created_at": comment.created_at.isoformat() if comment.created_at else "",
-            "updated_at": comment.updated_at.isoformat() if comment.updated_at else "",
-            "html_url": comment.html_url,
-            "issue_number": issue_number,
-            "repository": f"{owner}/{repo_name}",
-            "success": True
-        }
+    # Skip if this is actually a pull request
+    if issue.get("pull_request"):
+        raise ValueError(f"Issue #{issue_number} is actually a pull request. Use PR-specific tools instead.")
+
+    # Check if the issue is locked
+    if issue["locked"]:
+        raise Exception(f"Issue #{issue_number} is locked and cannot accept new comments.")
 
-        return result
+    # Validate comment body
+    if not comment_body or not comment_body.strip():
+        raise ValueError("Comment body cannot be empty.")
+
+    # Add the comment
+    response = await _gh_request(
+        "POST",
+        f"/repos/{owner}/{repo_name}/issues/{issue_number}/comments",
+        json={"body": comment_body.strip()}
+    )
+    response.raise_for_status()
+    comment = _parse_json(response)
+
+    # Return the created comment information
+    result = {
+        "id": comment["id"],
+        "body": comment["body"],
+        "author": _login(comment["user"]),
+        "author_association": comment.get("author_association", "NONE"),
+        "created_at": comment["created_at"] or "",
+        "updated_at": comment["updated_at"] or "",
+        "html_url": comment["html_url"],
+        "issue_number": issue_number,
+        "repository": repository,
+        "success": True
+    }
 
-    except Exception as e:
-        raise Exception(f"Error adding comment to issue: {str(e)}")
+    return result
 
 @mcp.tool(description="Update an existing comment on a GitHub issue")
-def updateIssueComment(repository: str, comment_id: int, comment_body: str) -> Dict[str, Any]:
+@_gh_tool("updating comment")
+async def updateIssueComment(repository: str, comment_id: int, comment_body: str) -> Dict[str, Any]:
     """
     Update an existing comment on a GitHub issue.
 
@@ -422,101 +645,176 @@ def updateIssueComment(repository: str, comment_id: int, comment_body: str) -> D
     Returns:
         Dictionary with the updated comment information
     """
-    try:
-        github = get_github_client()
+    # Check if we have authentication
+    if not _HAS_TOKEN:
+        raise Exception("GitHub token is required to update comments. Please set the GITHUB_TOKEN environment variable.")
 
-        # Check if we have authentication
-        if not os.environ.get("GITHUB_TOKEN"):
-            raise Exception("GitHub token is required to update comments. Please set the GITHUB_TOKEN environment variable.")
+    owner, repo_name = parse_repository(repository)
 
-        owner, repo_name = parse_repository(repository)
+    # Validate comment body
+    if not comment_body or not comment_body.strip():
+        raise ValueError("Comment body cannot be empty.")
 
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
-
-        # Get the specific comment
-        comment = repo.get_issue_comment(comment_id)
-
-        # Validate comment body
-        if not comment_body or not comment_body.strip():
-            raise ValueError("Comment body cannot be empty.")
-
-        # Update the comment
-        comment.edit(comment_body.strip())
-
-        # Return the updated comment information
-        result = {
-            "id": comment.id,
-            "body": comment.body,
-            "author": comment.user.login if comment.user else "Unknown",
-            "author_association": comment.author_association if hasattr(comment, 'author_association') else "NONE",
-            "created_at": comment.created_at.isoformat() if comment.created_at else "",
-            "updated_at": comment.updated_at.isoformat() if comment.updated_at else "",
-            "html_url": comment.html_url,
-            "repository": f"{owner}/{repo_name}",
-            "success": True,
-            "action": "updated"
-        }
+    # Update the comment (the response carries the updated comment)
+    response = await _gh_request(
+        "PATCH",
+        f"/repos/{owner}/{repo_name}/issues/comments/{comment_id}",
+        json={"body": comment_body.strip()}
+    )
+    response.raise_for_status()
+    comment = _parse_json(response)
+
+    # Return the updated comment information
+    result = {
+        "id": comment["id"],
+        "body": comment["body"],
+        "author": _login(comment["user"]),
+        "author_association": comment.get("author_association", "NONE"),
+        "created_at": comment["created_at"] or "",
+        "updated_at": comment["updated_at"] or "",
+        "html_url": comment["html_url"],
+        "repository": repository,
+        "success": True,
+        "action": "updated"
+    }
 
-        return result
+    return result
 
-    except Exception as e:
-        raise Exception(f"Error updating comment: {str(e)}")
+def _project_release(release: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a release payload onto the fields returned by fetchReleases"""
+    # Assets are embedded in the release list, no extra request needed
+    assets = release.get("assets") or []
+    body = release.get("body") or ""
+
+    return {
+        "tag_name": release["tag_name"],
+        "name": release["name"] if release["name"] else release["tag_name"],
+        "author": _login(release["author"]),
+        "published_at": release["published_at"] or "",
+        "created_at": release["created_at"] or "",
+        "prerelease": release["prerelease"],
+        "draft": release["draft"],
+        "body": body[:500] + "..." if len(body) > 500 else body,
+        "download_count": sum(asset["download_count"] for asset in assets),
+        "assets_count": len(assets),
+        "html_url": release["html_url"]
+    }
 
 @mcp.tool(description="Fetch releases from a GitHub repository")
-def fetchReleases(repository: str, per_page: int = 30) -> List[Dict[str, Any]]:
+@_gh_tool("fetching releases")
+async def fetchReleases(repository: str, per_page: int = 30, include_body: bool = True) -> List[Dict[str, Any]]:
     """
     Fetch releases from a GitHub repository.
 
     Args:
         repository: Repository in format 'owner/repo' (e.g., 'microsoft/vscode')
         per_page: Number of releases to fetch (max 100, default 30)
+        include_body: Include release notes, truncated to 500 characters (default True)
 
     Returns:
         List of release objects with tag_name, name, author, published_at, prerelease, draft, and html_url
     """
-    try:
-        github = get_github_client()
-        owner, repo_name = parse_repository(repository)
+    owner, repo_name = parse_repository(repository)
+
+    # Prepare parameters
+    per_page = _page_size(per_page)
+
+    # Get releases
+    releases = await _gh_get(
+        f"/repos/{owner}/{repo_name}/releases",
+        {"per_page": per_page},
+        lambda releases: [_project_release(release) for release in releases]
+    )
+
+    # Cached rows are shared, so drop the release notes from copies
+    if not include_body:
+        return [{key: value for key, value in release.items() if key != "body"} for release in releases]
+    return releases
+
+# Repository statistics move slowly, so serve repeated requests from memory
+_repo_stats_cache: TTLCache = TTLCache(maxsize=512, ttl=120)
+
+async def _repo_stats_one(repository: str) -> Dict[str, Any]:
+    """Get statistics and health metrics of a single repository"""
+    stats = _repo_stats_cache.get(repository)
+    if stats is None:
+        stats = await _fetch_repo_stats(repository)
+    return stats
+
+async def _fetch_repo_stats(repository: str) -> Dict[str, Any]:
+    """Fetch statistics and health metrics of a single repository from GitHub"""
+    owner, repo_name = parse_repository(repository)
+    repo_url = f"/repos/{owner}/{repo_name}"
+
+    # Get repository, language breakdown and contributor count concurrently
+    # (languages and contributors might fail for private repos without token)
+    repo, languages, contributors_count = await asyncio.gather(
+        _gh_get(repo_url),
+        _gh_get(f"{repo_url}/languages"),
+        _gh_count(f"{repo_url}/contributors", {"anon": "true"}),
+        return_exceptions=True
+    )
+    if isinstance(repo, Exception):
+        raise repo
+
+    # Get basic stats
+    stats = {
+        "name": repo["name"],
+        "full_name": repo["full_name"],
+        "description": repo["description"],
+        "stars": repo["stargazers_count"],
+        "forks": repo["forks_count"],
+        "watchers": repo["watchers_count"],
+        "open_issues": repo["open_issues_count"],
+        "size_kb": repo["size"],
+        "language": repo["language"],
+        "languages": languages if not isinstance(languages, Exception) else {},
+        "created_at": repo["created_at"] or "",
+        "updated_at": repo["updated_at"] or "",
+        "pushed_at": repo["pushed_at"] or "",
+        "default_branch": repo["default_branch"],
+        "archived": repo["archived"],
+        "disabled": repo["disabled"],
+        "private": repo["private"],
+        "fork": repo["fork"],
+        "has_issues": repo["has_issues"],
+        "has_projects": repo["has_projects"],
+        "has_wiki": repo["has_wiki"],
+        "has_pages": repo["has_pages"],
+        "license": repo["license"]["name"] if repo["license"] else None,
+        "html_url": repo["html_url"],
+        "contributors_count": contributors_count if not isinstance(contributors_count, Exception) else 0
+    }
 
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
-
-        # Prepare parameters
-        per_page = min(per_page, 100)  # GitHub API limit
-
-        # Get releases
-        releases = repo.get_releases()
-
-        # Convert to list with pagination
-        results = []
-        count = 0
-        for release in releases:
-            if count >= per_page:
-                break
-
-            results.append({
-                "tag_name": release.tag_name,
-                "name": release.title if release.title else release.tag_name,
-                "author": release.author.login if release.author else "Unknown",
-                "published_at": release.published_at.isoformat() if release.published_at else "",
-                "created_at": release.created_at.isoformat() if release.created_at else "",
-                "prerelease": release.prerelease,
-                "draft": release.draft,
-                "body": release.body[:500] + "..." if release.body and len(release.body) > 500 else release.body,
-                "download_count": sum(asset.download_count for asset in release.get_assets()) if release.get_assets() else 0,
-                "assets_count": release.get_assets().totalCount if release.get_assets() else 0,
-                "html_url": release.html_url
-            })
-            count += 1
-
-        return results
-
-    except Exception as e:
-        raise Exception(f"Error fetching releases: {str(e)}")
+    # Calculate health score (simple metric)
+    health_score = 0
+    if repo["description"]:
+        health_score += 10
+    if repo["license"]:
+        health_score += 15
+    if repo["has_wiki"]:
+        health_score += 10
+    if repo["has_issues"]:
+        health_score += 10
+    if stats["contributors_count"] > 1:
+        health_score += 15
+    if repo["stargazers_count"] > 10:
+        health_score += 20
+    if repo["stargazers_count"] > 100:
+        health_score += 20
+
+    stats["health_score"] = min(health_score, 100)
+
+    # Don't serve a transient failure for the whole TTL. Definitive 4xx answers
+    # (e.g. 403 when the contributor list is too large) are cached like successes.
+    if not any(isinstance(result, Exception) and _is_transient(result) for result in (languages, contributors_count)):
+        _repo_stats_cache[repository] = stats
+
+    return stats
 
 @mcp.tool(description="Get repository statistics and health metrics")
-def getRepoStats(repository: str) -> Dict[str, Any]:
+@_gh_tool("fetching repository stats")
+async def getRepoStats(repository: str) -> Dict[str, Any]:
     """
     Get comprehensive repository statistics and health metrics.
 
@@ -526,81 +824,73 @@ def getRepoStats(repository: str) -> Dict[str, Any]:
     Returns:
         Dictionary with repository statistics including stars, forks, issues, size, and health metrics
     """
-    try:
-        github = get_github_client()
-        owner, repo_name = parse_repository(repository)
+    return await _repo_stats_one(repository)
 
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
-
-        # Get basic stats
-        stats = {
-            "name": repo.name,
-            "full_name": repo.full_name,
-            "description": repo.description,
-            "stars": repo.stargazers_count,
-            "forks": repo.forks_count,
-            "watchers": repo.watchers_count,
-            "open_issues": repo.open_issues_count,
-            "size_kb": repo.size,
-            "language": repo.language,
-            "languages": {},
-            "created_at": repo.created_at.isoformat() if repo.created_at else "",
-            "updated_at": repo.updated_at.isoformat() if repo.updated_at else "",
-            "pushed_at": repo.pushed_at.isoformat() if repo.pushed_at else "",
-            "default_branch": repo.default_branch,
-            "archived": repo.archived,
-            "disabled": repo.disabled,
-            "private": repo.private,
-            "fork": repo.fork,
-            "has_issues": repo.has_issues,
-            "has_projects": repo.has_projects,
-            "has_wiki": repo.has_wiki,
-            "has_pages": repo.has_pages,
-            "license": repo.license.name if repo.license else None,
-            "html_url": repo.html_url
-        }
+@mcp.tool(description="Get statistics and health metrics for several repositories at once")
+async def getRepoStatsMulti(repositories: List[str]) -> Dict[str, Any]:
+    """
+    Get repository statistics and health metrics for several repositories concurrently.
 
-        # Get language breakdown (this might fail for private repos without token)
-        try:
-            languages = repo.get_languages()
-            stats["languages"] = dict(languages)
-        except Exception:
-            stats["languages"] = {}
-
-        # Get contributor count (approximate)
-        try:
-            contributors = repo.get_contributors()
-            stats["contributors_count"] = contributors.totalCount
-        except Exception:
-            stats["contributors_count"] = 0
-
-        # Calculate health score (simple metric)
-        health_score = 0
-        if repo.description:
-            health_score += 10
-        if repo.license:
-            health_score += 15
-        if repo.has_wiki:
-            health_score += 10
-        if repo.has_issues:
-            health_score += 10
-        if stats["contributors_count"] > 1:
-            health_score += 15
-        if repo.stargazers_count > 10:
-            health_score += 20
-        if repo.stargazers_count > 100:
-            health_score += 20
-
-        stats["health_score"] = min(health_score, 100)
-
-        return stats
-
-    except Exception as e:
-        raise Exception(f"Error fetching repository stats: {str(e)}")
+    Args:
+        repositories: Repositories in format 'owner/repo' (e.g., ['microsoft/vscode', 'facebook/react'])
+
+    Returns:
+        Dictionary mapping each repository to its statistics, or to an error object if fetching failed
+    """
+    return await _gather_repositories(repositories, _repo_stats_one, "Error fetching repository stats")
+
+# Workflow names by id for each repository, refreshed every five minutes
+_workflow_name_cache: TTLCache = TTLCache(maxsize=256, ttl=300)
+
+async def _get_workflow_names(owner: str, repo_name: str) -> Dict[int, str]:
+    """Get the names of all workflows of a repository, fetching any further pages concurrently"""
+    key = f"{owner}/{repo_name}"
+    names = _workflow_name_cache.get(key)
+    if names is None:
+        url = f"/repos/{owner}/{repo_name}/actions/workflows"
+
+        def project(data: Dict[str, Any]) -> Tuple[int, Dict[int, str]]:
+            return data["total_count"], {workflow["id"]: workflow["name"] for workflow in data["workflows"]}
+
+        total_count, names = await _gh_get(url, {"per_page": 100}, project)
+        names = dict(names)
+
+        # Repositories with more than 100 workflows need the remaining pages too
+        page_count = -(-total_count // 100)
+        if page_count > 1:
+            pages = await asyncio.gather(*[
+                _gh_get(url, {"per_page": 100, "page": page}, project) for page in range(2, page_count + 1)
+            ])
+            for _, page_names in pages:
+                names.update(page_names)
+
+        _workflow_name_cache[key] = names
+    return names
+
+def _project_workflow_run(run: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a workflow run payload onto the fields returned by fetchWorkflowRuns, leaving a missing workflow name as None"""
+    # The run payload normally carries the name of its workflow
+    workflow_name = run.get("name") or None
+
+    return {
+        "id": run["id"],
+        "name": workflow_name,
+        "workflow_name": workflow_name,
+        "status": run["status"],
+        "conclusion": run["conclusion"],
+        "event": run["event"],
+        "branch": run["head_branch"],
+        "commit_sha": run["head_sha"][:8] if run["head_sha"] else "",
+        "created_at": run["created_at"] or "",
+        "updated_at": run["updated_at"] or "",
+        "run_number": run["run_number"],
+        "actor": _login(run["actor"]),
+        "html_url": run["html_url"]
+    }
 
 @mcp.tool(description="Fetch GitHub Actions workflow runs")
-def fetchWorkflowRuns(repository: str, per_page: int = 30, status: str = None, branch: str = None) -> List[Dict[str, Any]]:
+@_gh_tool("fetching workflow runs")
+async def fetchWorkflowRuns(repository: str, per_page: int = 30, status: str = None, branch: str = None) -> List[Dict[str, Any]]:
     """
     Fetch GitHub Actions workflow runs from a repository.
 
@@ -613,72 +903,155 @@ def fetchWorkflowRuns(repository: str, per_page: int = 30, status: str = None, b
     Returns:
         List of workflow run objects with id, name, status, conclusion, created_at, and html_url
     """
-    try:
-        github = get_github_client()
-        owner, repo_name = parse_repository(repository)
+    owner, repo_name = parse_repository(repository)
+
+    # Prepare parameters
+    per_page = _page_size(per_page)
+    params = {"per_page": per_page}
+
+    if status:
+        params["status"] = status
+    if branch:
+        params["branch"] = branch
+
+    # Get workflow runs, keeping each run's workflow id to resolve missing names
+    runs = await _gh_get(
+        f"/repos/{owner}/{repo_name}/actions/runs",
+        params,
+        lambda data: [(run["workflow_id"], _project_workflow_run(run)) for run in data["workflow_runs"]]
+    )
 
-        # Get repository
-        repo = github.get_repo(f"{owner}/{repo_name}")
+    # Look up workflow names only if some run does not carry one
+    if all(run["name"] for _, run in runs):
+        return [run for _, run in runs]
+
+    workflow_names = await _get_workflow_names(owner, repo_name)
+    results = []
+    for workflow_id, run in runs:
+        if not run["name"]:
+            # Cached rows are shared, so fill the name in on a copy
+            workflow_name = workflow_names.get(workflow_id, "Unknown")
+            run = {**run, "name": workflow_name, "workflow_name": workflow_name}
+        results.append(run)
+    return results
+
+# Commits, open pull requests, open issues and headline stats of a repository in one request
+_DASHBOARD_QUERY = """
+query($owner: String!, $name: String!, $n: Int!) {
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    stargazerCount
+    forkCount
+    url
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: $n) {
+            nodes { oid message authoredDate author { name } url }
+          }
+        }
+      }
+    }
+    pullRequests(first: $n, states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes { number title author { login } state createdAt url }
+    }
+    issues(first: $n, states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number title author { login } state createdAt url
+        labels(first: 10) { nodes { name } }
+        assignees(first: 10) { nodes { login } }
+      }
+    }
+  }
+}
+"""
 
-        # Prepare parameters
-        per_page = min(per_page, 100)  # GitHub API limit
-        kwargs = {}
+@mcp.tool(description="Get a dashboard snapshot of a GitHub repository: recent commits, open PRs, open issues and stats in one request")
+@_gh_tool("fetching dashboard snapshot")
+async def dashboardSnapshot(repository: str, per_page: int = 10) -> Dict[str, Any]:
+    """
+    Get recent commits, open pull requests, open issues and headline stats of a repository with a single GraphQL request.
 
-        if status:
-            kwargs["status"] = status
-        if branch:
-            kwargs["branch"] = branch
+    Args:
+        repository: Repository in format 'owner/repo' (e.g., 'microsoft/vscode')
+        per_page: Number of commits, PRs and issues to fetch each (max 100, default 10)
 
-        # Get workflow runs
-        runs = repo.get_workflow_runs(**kwargs)
+    Returns:
+        Dictionary with stars, forks, and lists of commits, pull requests and issues shaped like fetchNewCommits, fetchNewPRs and fetchNewIssues
+    """
+    # Check if we have authentication (GitHub's GraphQL API requires it)
+    if not _HAS_TOKEN:
+        raise Exception("GitHub token is required for dashboard snapshots. Please set the GITHUB_TOKEN environment variable.")
 
-        # Convert to list with pagination
-        results = []
-        count = 0
-        for run in runs:
-            if count >= per_page:
-                break
+    owner, repo_name = parse_repository(repository)
 
-            # Get workflow name (might require additional API call)
-            workflow_name = "Unknown"
-            try:
-                if run.workflow_id:
-                    workflow = repo.get_workflow(run.workflow_id)
-                    workflow_name = workflow.name
-            except Exception:
-                pass
-
-            results.append({
-                "id": run.id,
-                "name": run.name if hasattr(run, 'name') and run.name else workflow_name,
-                "workflow_name": workflow_name,
-                "status": run.status,
-                "conclusion": run.conclusion,
-                "event": run.event,
-                "branch": run.head_branch,
-                "commit_sha": run.head_sha[:8] if run.head_sha else "",
-                "created_at": run.created_at.isoformat() if run.created_at else "",
-                "updated_at": run.updated_at.isoformat() if run.updated_at else "",
-                "run_number": run.run_number,
-                "actor": run.actor.login if run.actor else "Unknown",
-                "html_url": run.html_url
-            })
-            count += 1
-
-        return results
-
-    except Exception as e:
-        raise Exception(f"Error fetching workflow runs: {str(e)}")
+    # Get everything in one round-trip
+    data = await _gh_graphql(_DASHBOARD_QUERY, {"owner": owner, "name": repo_name, "n": _page_size(per_page)})
+    repo = data["repository"]
+    if not repo:
+        raise ValueError(f"Repository {repository} not found")
+
+    # Empty repositories have no default branch
+    branch = repo["defaultBranchRef"]
+    commits = branch["target"]["history"]["nodes"] if branch else []
+
+    # Rows mirror _project_commit, _project_pull and _project_issue, keep the
+    # shapes in sync when those change
+    return {
+        "repository": repo["nameWithOwner"],
+        "stars": repo["stargazerCount"],
+        "forks": repo["forkCount"],
+        "html_url": repo["url"],
+        "commits": [{
+            "sha": commit["oid"],
+            "message": commit["message"],
+            "author": (commit["author"] or {}).get("name") or "Unknown",
+            "date": commit["authoredDate"] or "",
+            "url": commit["url"]
+        } for commit in commits],
+        "pull_requests": [{
+            "number": pr["number"],
+            "title": pr["title"],
+            "author": _login(pr["author"]),
+            "state": pr["state"].lower(),
+            "created_at": pr["createdAt"] or "",
+            "html_url": pr["url"]
+        } for pr in repo["pullRequests"]["nodes"]],
+        "issues": [{
+            "number": issue["number"],
+            "title": issue["title"],
+            "author": _login(issue["author"]),
+            "state": issue["state"].lower(),
+            "created_at": issue["createdAt"] or "",
+            "labels": [label["name"] for label in issue["labels"]["nodes"]],
+            "assignees": [assignee["login"] for assignee in issue["assignees"]["nodes"]],
+            "html_url": issue["url"]
+        } for issue in repo["issues"]["nodes"]]
+    }
+
+# Number of uvicorn worker processes serving the MCP endpoint
+WORKERS = int(os.environ.get("WORKERS", 1))
+
+# ASGI app for the MCP endpoint. Sessions live in the worker that created them,
+# so with several workers each request must be handled statelessly.
+app = mcp.http_app(stateless_http=WORKERS > 1)
 
 if __name__ == "__main__":
+    import uvicorn
+
     port = int(os.environ.get("PORT", 8000))
     host = "0.0.0.0"
 
-    print(f"Starting GitPulse FastMCP server on {host}:{port}")
-    print(f"GitHub token configured: {bool(os.environ.get('GITHUB_TOKEN'))}")
+    print(f"Starting GitPulse FastMCP server on {host}:{port} with {WORKERS} worker(s)")
+    print(f"GitHub token configured: {_HAS_TOKEN}")
 
-    mcp.run(
-        transport="http",
+    # Multiple workers need an import string so each process can load the app.
+    # uvicorn picks uvloop and httptools when they are installed.
+    uvicorn.run(
+        app if WORKERS == 1 else "server:app",
         host=host,
-        port=port
+        port=port,
+        loop="auto",
+        http="auto",
+        workers=WORKERS
     )